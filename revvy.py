@@ -1,13 +1,10 @@
 #!/usr/bin/python3
 # SPDX-License-Identifier: GPL-3.0-only
-import io
 import os
-import shutil
+import signal
 import sys
-import tarfile
-import traceback
-from contextlib import suppress
 from functools import partial
+from threading import Thread
 
 from revvy.revvy_utils import RobotBLEController, RevvyStatusCode
 from revvy.robot.robot import Robot
@@ -15,10 +12,11 @@ from revvy.robot.led_ring import RingLed
 from revvy.robot.status import RobotStatus
 from revvy.scripting.runtime import ScriptDescriptor
 from revvy.bluetooth.ble_revvy import Observable, RevvyBLE
+from revvy.utils.asset_extractor import extract_asset_longmessage
 from revvy.utils.error_handler import register_uncaught_exception_handler
 from revvy.utils.file_storage import FileStorage, MemoryStorage, create_unique_file
 from revvy.utils.functions import get_serial, read_json, str_to_func
-from revvy.bluetooth.longmessage import LongMessageHandler, LongMessageStorage, LongMessageType, LongMessageStatus, \
+from revvy.bluetooth.longmessage import LongMessageHandler, LongMessageStorage, LongMessageType, \
     ReceivedLongMessage
 from revvy.robot_config import empty_robot_config, RobotConfig, ConfigError
 from revvy.utils.logger import get_logger
@@ -29,58 +27,6 @@ from revvy.utils.logger import logger, LogLevel
 from tools.check_manifest import check_manifest
 
 
-def extract_asset_longmessage(storage, asset_dir):
-    """
-    Extract the ASSET_DATA long message into a folder.
-
-    After successfully extracting, store the checksum of the asset message in the .hash file.
-    Skip extracting if the long message has the same checksum as stored in the folder.
-    The folder will be deleted if exists before decompression.
-
-    @param storage: the source where the asset data message is stored
-    @param asset_dir: the destination directory
-    """
-
-    asset_status = storage.read_status(LongMessageType.ASSET_DATA)
-
-    if asset_status.status == LongMessageStatus.READY:
-        with suppress(Exception):
-            with open(os.path.join(asset_dir, '.hash'), 'r') as asset_hash_file:
-                stored_hash = asset_hash_file.read()
-
-            if stored_hash == asset_status.md5:
-                return
-
-        if os.path.isdir(asset_dir):
-            shutil.rmtree(asset_dir)
-
-        message_data = storage.get_long_message(LongMessageType.ASSET_DATA)
-        with tarfile.open(fileobj=io.StringIO(message_data), mode="r|gz") as tar:
-            def is_within_directory(directory, target):
-                
-                abs_directory = os.path.abspath(directory)
-                abs_target = os.path.abspath(target)
-            
-                prefix = os.path.commonprefix([abs_directory, abs_target])
-                
-                return prefix == abs_directory
-            
-            def safe_extract(tar, path=".", members=None, *, numeric_owner=False):
-            
-                for member in tar.getmembers():
-                    member_path = os.path.join(path, member.name)
-                    if not is_within_directory(path, member_path):
-                        raise Exception("Attempted Path Traversal in Tar File")
-            
-                tar.extractall(path, members, numeric_owner=numeric_owner) 
-                
-            
-            safe_extract(tar, path=asset_dir)
-
-        with open(os.path.join(asset_dir, '.hash'), 'w') as asset_hash_file:
-            asset_hash_file.write(asset_status.md5)
-
-
 class LongMessageImplementation:
     # TODO: this, together with the other long message classes is probably a lasagna worth simplifying
     def __init__(self, robot_manager: RobotBLEController, storage: LongMessageStorage, asset_dir, ignore_config):
@@ -183,7 +129,7 @@ class LongMessageImplementation:
                 else:
                     self._robot.configure(parsed_config, self._robot.start_remote_controller)
             except ConfigError:
-                self._log(traceback.format_exc())
+                self._log('Failed to parse configuration', exc_info=True)
 
         elif message_type == LongMessageType.FRAMEWORK_DATA:
             self._robot.robot.status.robot_status = RobotStatus.Updating
@@ -265,22 +211,34 @@ if __name__ == "__main__":
         long_message_handler.on_upload_finished(lmi.on_transmission_finished)
         long_message_handler.on_message_updated(lmi.on_message_updated)
 
+        def wait_for_enter():
+            try:
+                input()
+            except EOFError:
+                return
+
+            # manual exit
+            robot_manager.exit(RevvyStatusCode.OK)
+
         # noinspection PyBroadException
         try:
+            # exit requests are signalled through the exited event, the main thread is not interrupted
+            robot_manager.needs_interrupting = False
+            # stop cleanly when the service is stopped
+            signal.signal(signal.SIGTERM, lambda *_: robot_manager.exit(RevvyStatusCode.OK))
             robot_manager.start()
 
-            print("Press Enter to exit")
-            input()
-            # manual exit
-            ret_val = RevvyStatusCode.OK
-        except EOFError:
-            robot_manager.needs_interrupting = False
+            # there is no stdin when started as a service, only listen to it when running in a terminal
+            if sys.stdin is not None and sys.stdin.isatty():
+                print("Press Enter to exit")
+                Thread(target=wait_for_enter, name='StdinReaderThread', daemon=True).start()
+
             ret_val = robot_manager.wait_for_exit()
         except KeyboardInterrupt:
             # manual exit or update request
             ret_val = robot_manager.status_code
         except Exception:
-            print(traceback.format_exc())
+            logger.log('Unexpected error', LogLevel.ERROR, exc_info=True)
             ret_val = RevvyStatusCode.ERROR
         finally:
             print('stopping')
@@ -145,6 +145,12 @@ class LongMessageStorage:
         storage = self._get_storage(long_message_type)
         return storage.read(long_message_type)
 
+    def open_long_message(self, long_message_type):
+        """Open the stored message for streaming, without reading it into memory"""
+        self._log("open_long_message")
+        storage = self._get_storage(long_message_type)
+        return storage.open(long_message_type)
+
 
 class LongMessageHandler:
     """Implements the long message writer/status reader protocol"""
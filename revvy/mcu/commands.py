@@ -5,6 +5,7 @@ import traceback
 from abc import ABC
 from collections import namedtuple
 from enum import Enum
+from types import MappingProxyType
 
 from revvy.utils.functions import split
 from revvy.utils.logger import get_logger
@@ -19,9 +20,14 @@ class UnknownCommandError(Exception):
 class Command:
     """A generic command towards the MCU"""
 
-    def __init__(self, transport: RevvyTransport):
+    def __init__(self, transport: RevvyTransport, cache_response=False):
+        """
+        @param cache_response: reuse the first valid response. Use for values that can't change while the MCU runs
+        """
         self._transport = transport
         self._command_byte = self.command_id
+        self._cache_response = cache_response
+        self._cached_response = None
 
         self._log = get_logger(f'{type(self).__name__} [id={self._command_byte}]')
 
@@ -56,7 +62,16 @@ class Command:
         if args:
             raise NotImplementedError
 
-        return self._send()
+        response = self._cached_response
+        if response is None:
+            response = self._send()
+            if self._cache_response:
+                # the cached object is shared between callers, don't let them modify it
+                if type(response) is dict:
+                    response = MappingProxyType(response)
+                self._cached_response = response
+
+        return response
 
     def parse_response(self, payload):
         if payload:
@@ -357,15 +372,16 @@ def parse_string_list(data):
     {'foobar': 1, 'baz': 2}
     """
     val = {}
+    # slicing a memoryview does not copy, names are decoded straight from the payload buffer
+    data = memoryview(data)
     idx = 0
     while idx < len(data):
+        key = data[idx]
+        length = data[idx + 1]
         data_start = idx + 2
-        key, length = data[idx:data_start]
         idx = data_start + length
 
-        name = parse_string(data[data_start:data_start + length])
-
-        val[name] = key
+        val[str(data[data_start:idx], 'utf-8')] = key
     return val
 
 
@@ -12,7 +12,7 @@ class RevvyTransportBase:
 
 class BootloaderControl:
     def __init__(self, transport: RevvyTransport):
-        self.get_hardware_version = ReadHardwareVersionCommand(transport)
+        self.get_hardware_version = ReadHardwareVersionCommand(transport, cache_response=True)
         self.read_operation_mode = ReadOperationModeCommand(transport)
         self.send_init_update = InitializeUpdateCommand(transport)
         self.send_firmware = SendFirmwareCommand(transport)
@@ -22,23 +22,25 @@ class BootloaderControl:
 
 class RevvyControl:
     def __init__(self, transport: RevvyTransport):
+        # values that are fixed for the hardware or only read once per boot are cached.
+        # firmware version is not cached because it needs to be re-read after a firmware update
         self.ping = PingCommand(transport)
 
         self.set_master_status = SetMasterStatusCommand(transport)
         self.read_operation_mode = ReadOperationModeCommand(transport)
         self.set_bluetooth_connection_status = SetBluetoothStatusCommand(transport)
-        self.get_hardware_version = ReadHardwareVersionCommand(transport)
+        self.get_hardware_version = ReadHardwareVersionCommand(transport, cache_response=True)
         self.get_firmware_version = ReadFirmwareVersionCommand(transport)
         self.reboot_bootloader = RebootToBootloaderCommand(transport)
 
-        self.get_motor_port_amount = ReadMotorPortAmountCommand(transport)
-        self.get_motor_port_types = ReadMotorPortTypesCommand(transport)
+        self.get_motor_port_amount = ReadMotorPortAmountCommand(transport, cache_response=True)
+        self.get_motor_port_types = ReadMotorPortTypesCommand(transport, cache_response=True)
         self.set_motor_port_type = SetMotorPortTypeCommand(transport)
         self.set_motor_port_config = SetMotorPortConfigCommand(transport)
         self.set_motor_port_control_value = SetMotorPortControlCommand(transport)
 
-        self.get_sensor_port_amount = ReadSensorPortAmountCommand(transport)
-        self.get_sensor_port_types = ReadSensorPortTypesCommand(transport)
+        self.get_sensor_port_amount = ReadSensorPortAmountCommand(transport, cache_response=True)
+        self.get_sensor_port_types = ReadSensorPortTypesCommand(transport, cache_response=True)
         self.set_sensor_port_type = SetSensorPortTypeCommand(transport)
         self.write_sensor_port = WriteSensorPortCommand(transport)
         self.read_sensor_info = ReadSensorPortInfoCommand(transport)
@@ -173,6 +173,10 @@ class RevvyTransport:
         self._transport = transport
         self._stopwatch = Stopwatch()
 
+        # frames without payload only depend on the command id, so they are built only once
+        self._start_frames = {}
+        self._get_result_frames = {}
+
     def send_command(self, command, payload=b'') -> Response:
         """
         Send a command and get the result.
@@ -188,7 +192,13 @@ class RevvyTransport:
             # create commands in advance, they can be reused in case of an error
             # if command != 60 and command != 9:
             #     print("command:", command, "payload:", payload)
-            command_start = Command.start(command, payload)
+            if payload:
+                command_start = Command.start(command, payload)
+            else:
+                # ping, status reads, etc.
+                command_start = self._start_frames.get(command)
+                if command_start is None:
+                    command_start = self._start_frames[command] = bytes(Command.start(command, b''))
             command_get_result = None
 
             try:
@@ -201,7 +211,10 @@ class RevvyTransport:
                     if header.status == ResponseStatus.Pending:
                         # lazily create GetResult command
                         if not command_get_result:
-                            command_get_result = Command.get_result(command)
+                            command_get_result = self._get_result_frames.get(command)
+                            if command_get_result is None:
+                                command_get_result = bytes(Command.get_result(command))
+                                self._get_result_frames[command] = command_get_result
 
                         header = self._send_command(command_get_result)
                         while header.status == ResponseStatus.Pending:
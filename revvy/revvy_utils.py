@@ -5,6 +5,7 @@ import os
 import signal
 import traceback
 import time
+from collections import deque
 from functools import partial
 from threading import Event
 
@@ -30,6 +31,9 @@ class RevvyStatusCode(enum.IntEnum):
 
 
 class RobotBLEController:
+    # [seconds] how often the MCU status is read. Shorter periods mean lower sensor and motor latency
+    # at the cost of more CPU time and bus traffic
+    status_update_period = 0.005
 
     # FIXME: revvy_ble intentionally doesn't have a type hint at this moment because it breaks tests right now
     def __init__(self, robot: Robot, sw_version, revvy_ble):
@@ -42,8 +46,9 @@ class RobotBLEController:
         self._ble = revvy_ble
         self._sw_version = sw_version
 
-        self._status_update_thread = periodic(self._update, 0.005, "RobotStatusUpdaterThread")
-        self._background_fns = []
+        self._status_update_thread = periodic(self._update, self.status_update_period, "RobotStatusUpdaterThread")
+        # deque.append and deque.popleft are atomic, so no function can get lost between the threads
+        self._background_fns = deque()
 
         rc = RemoteController()
         rcs = RemoteControllerScheduler(rc)
@@ -81,11 +86,14 @@ class RobotBLEController:
             self._ble['battery_service'].characteristic('main_battery').update_value(self._robot.battery.main)
             self._ble['battery_service'].characteristic('motor_battery').update_value(self._robot.battery.motor)
 
-            fns, self._background_fns = self._background_fns, []
+            fns = self._background_fns
 
             if fns:
-                for i, fn in enumerate(fns):
-                    self._log(f'Running {i}/{len(fns)} background functions')
+                # functions registered while these are running will be run in the next update
+                count = len(fns)
+                for i in range(count):
+                    fn = fns.popleft()
+                    self._log(f'Running {i}/{count} background functions')
                     print("     fn:   ", fn)
                     fn()
 
@@ -213,9 +221,9 @@ class RobotBLEController:
         live_service = self._ble['live_message_service']
 
         # set up motors
+        self._robot.motors.configure_all(config.motors)
         for motor in self._robot.motors:
             print("motor", config.motors[motor.id])
-            motor.configure(config.motors[motor.id])
             motor.on_status_changed.add(lambda p: live_service.update_motor(p.id, p.power, p.speed, p.pos))
 
         for motor_id in config.drivetrain['left']:
@@ -227,9 +235,9 @@ class RobotBLEController:
             self._robot.drivetrain.add_right_motor(self._robot.motors[motor_id])
 
         # set up sensors
+        self._robot.sensors.configure_all(config.sensors)
         for sensor in self._robot.sensors:
             print("sensor", config.sensors[sensor.id])
-            sensor.configure(config.sensors[sensor.id])
             sensor.on_status_changed.add(lambda p: live_service.update_sensor(p.id, p.raw_value))
 
         def start_analog_script(src, channels):
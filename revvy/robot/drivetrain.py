@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import itertools
-from contextlib import suppress
 from threading import Timer
 
 from revvy.mcu.rrrc_control import RevvyControl
@@ -85,7 +84,8 @@ class MoveController(DrivetrainController):
         drivetrain._apply_positions(left, right, left_speed, right_speed, power_limit)
 
     def update(self):
-        if all(m.status == MotorStatus.GOAL_REACHED for m in self._drivetrain.motors):
+        drivetrain = self._drivetrain
+        if drivetrain._goal_reached_mask == drivetrain._all_motors_mask:
             self._awaiter.finish()
 
 
@@ -102,6 +102,9 @@ class DifferentialDrivetrain:
         self._imu = imu
         self._controller = None
 
+        self._update_motor_commands()
+        self._update_motor_masks()
+
     @property
     def yaw(self):
         return self._imu.yaw_angle
@@ -134,12 +137,49 @@ class DifferentialDrivetrain:
         self._motors.clear()
         self._left_motors.clear()
         self._right_motors.clear()
+        self._update_motor_commands()
+        self._update_motor_masks()
+
+    def _update_motor_masks(self):
+        """Assign a bit to each motor so that motor states can be checked with a single comparison"""
+        self._motor_bits = {motor: 1 << i for i, motor in enumerate(self._motors)}
+        self._all_motors_mask = (1 << len(self._motors)) - 1
+        self._goal_reached_mask = 0
+        self._blocked_mask = 0
+
+        for motor in self._motors:
+            self._update_motor_status_masks(motor)
+
+    def _update_motor_status_masks(self, motor):
+        bit = self._motor_bits.get(motor, 0)
+        status = motor.status
+
+        if status == MotorStatus.GOAL_REACHED:
+            self._goal_reached_mask |= bit
+        else:
+            self._goal_reached_mask &= ~bit
+
+        if status == MotorStatus.BLOCKED:
+            self._blocked_mask |= bit
+        else:
+            self._blocked_mask &= ~bit
+
+    def _update_motor_commands(self):
+        """Cache the command builders and the constant release command, these only change with the motor set"""
+        self._left_speed_fns = tuple(motor.create_set_speed_command for motor in self._left_motors)
+        self._right_speed_fns = tuple(motor.create_set_speed_command for motor in self._right_motors)
+        self._release_command = bytes(itertools.chain(
+            *(motor.create_set_power_command(0) for motor in self._left_motors),
+            *(motor.create_set_power_command(0) for motor in self._right_motors)
+        ))
 
     def _add_motor(self, motor: PortInstance):
         self._motors.append(motor)
 
         motor.on_status_changed.add(self._on_motor_status_changed)
         motor.on_config_changed.add(self._on_motor_config_changed)
+        self._update_motor_commands()
+        self._update_motor_masks()
 
     def add_left_motor(self, motor: PortInstance):
         self._log(f'Add motor {motor.id} to left side')
@@ -155,14 +195,19 @@ class DifferentialDrivetrain:
         # if a motor config changes, remove the motor from the drivetrain
         self._motors.remove(motor)
 
-        with suppress(ValueError):
+        if motor in self._left_motors:
             self._left_motors.remove(motor)
 
-        with suppress(ValueError):
+        if motor in self._right_motors:
             self._right_motors.remove(motor)
 
-    def _on_motor_status_changed(self, _):
-        if all(m.status == MotorStatus.BLOCKED for m in self._motors):
+        self._update_motor_commands()
+        self._update_motor_masks()
+
+    def _on_motor_status_changed(self, motor):
+        self._update_motor_status_masks(motor)
+
+        if self._blocked_mask == self._all_motors_mask:
             self._abort_controller()
         else:
             controller = self._controller
@@ -170,16 +215,12 @@ class DifferentialDrivetrain:
                 controller.update()
 
     def _apply_release(self):
-        commands = itertools.chain(
-            *(motor.create_set_power_command(0) for motor in self._left_motors),
-            *(motor.create_set_power_command(0) for motor in self._right_motors)
-        )
-        self._interface.set_motor_port_control_value(bytes(commands))
+        self._interface.set_motor_port_control_value(self._release_command)
 
     def _apply_speeds(self, left, right, power_limit):
         commands = itertools.chain(
-            *(motor.create_set_speed_command(left, power_limit) for motor in self._left_motors),
-            *(motor.create_set_speed_command(right, power_limit) for motor in self._right_motors)
+            *(create_command(left, power_limit) for create_command in self._left_speed_fns),
+            *(create_command(right, power_limit) for create_command in self._right_speed_fns)
         )
         self._interface.set_motor_port_control_value(bytes(commands))
 
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: GPL-3.0-only
-from contextlib import suppress
+from collections import UserDict
 
 from revvy.mcu.rrrc_control import RevvyControl
 from revvy.utils.logger import get_logger
@@ -7,31 +7,41 @@ from revvy.utils.logger import get_logger
 
 class FunctionAggregator:
     def __init__(self):
-        self._callbacks = []
+        # callbacks are stored as dict keys: calls keep the registration order and removal does not need a scan
+        self._callbacks = {}
 
-        self.add = self._callbacks.append
         self.clear = self._callbacks.clear
 
-    def remove(self, callback):
-        with suppress(ValueError):
-            self._callbacks.remove(callback)
+    def add(self, callback):
+        """Register a callback, registering the same callback again has no effect
+
+        @return: token that can be passed to remove()"""
+        self._callbacks[callback] = callback
+        return callback
+
+    def remove(self, token):
+        self._callbacks.pop(token, None)
 
     def __call__(self, *args, **kwargs):
-        for func in self._callbacks:
-            func(*args, **kwargs)
+        callbacks = self._callbacks
+        if not callbacks:
+            return
+
+        if len(callbacks) == 1:
+            next(iter(callbacks.values()))(*args, **kwargs)
+        else:
+            # iterate over a snapshot so that callbacks can safely add or remove callbacks
+            for func in tuple(callbacks.values()):
+                func(*args, **kwargs)
 
 
 class PortDriver:
     def __init__(self, port: 'PortInstance', driver):
-        self._driver = driver
+        self.driver = driver
         self._port = port
         self._on_status_changed = FunctionAggregator()
         self.log = get_logger(f'[{driver}]', base=port.log)
 
-    @property
-    def driver(self):
-        return self._driver
-
     @property
     def on_status_changed(self):
         return self._on_status_changed
@@ -43,20 +53,46 @@ class PortDriver:
         self._on_status_changed.clear()
 
 
+class _PortAliases(UserDict):
+    """Alias name -> port index map that keeps the lookup table of a PortCollection up to date"""
+
+    def __init__(self, lookup: dict):
+        self._lookup = lookup
+        self._ports = dict(lookup)
+        super().__init__()
+
+    def __setitem__(self, alias, port_idx):
+        super().__setitem__(alias, port_idx)
+        if port_idx in self._ports:
+            self._lookup[alias] = self._ports[port_idx]
+        else:
+            self._lookup.pop(alias, None)
+
+    def __delitem__(self, alias):
+        super().__delitem__(alias)
+        self._lookup.pop(alias, None)
+
+
 class PortCollection:
+    __slots__ = ('_ports', '_lookup', '_alias_map')
+
     def __init__(self, ports):
         self._ports = list(ports)
-        self._alias_map = {}
+        # ports can be looked up by their index (starting from 1) or by their alias with a single dict access
+        self._lookup = {i: port for i, port in enumerate(self._ports, start=1)}
+        self._alias_map = _PortAliases(self._lookup)
 
     @property
     def aliases(self):
         return self._alias_map
 
     def __getitem__(self, item):
-        if type(item) is str:
-            item = self._alias_map[item]
-
-        return self._ports[item - 1]
+        try:
+            return self._lookup[item]
+        except KeyError:
+            if type(item) is int:
+                raise IndexError(f'Port index out of range: {item}') from None
+            raise
 
     def __iter__(self):
         return self._ports.__iter__()
@@ -66,32 +102,35 @@ class PortHandler:
     def __init__(self, name, interface: RevvyControl, default_driver, amount: int, supported: dict):
         self._log = get_logger(f"PortHandler[{name}]")
         self._types = supported
-        self._port_count = amount
         self._default_driver = default_driver
-        self._ports = {i: PortInstance(i, f'{name}Port', interface, self.configure_port) for i in range(1, amount + 1)}
+        self.port_count = amount
+        self.available_types = tuple(supported.keys())
+        self._ports = tuple(PortInstance(i, f'{name}Port', interface, self.configure_port)
+                            for i in range(1, amount + 1))
+        self._applied_types = {}
 
         self._log(f'Created handler for {amount} ports')
         self._log('Supported types:\n  {}'.format("\n  ".join(self.available_types)))
 
     def __getitem__(self, port_idx):
-        return self._ports[port_idx]
+        # ports are indexed from 1, also make sure negative indexes don't wrap around
+        if 0 < port_idx <= self.port_count:
+            return self._ports[port_idx - 1]
+        raise KeyError(port_idx)
 
     def __iter__(self):
-        return self._ports.values().__iter__()
-
-    @property
-    def available_types(self):
-        """List of names of the supported drivers"""
-        return self._types.keys()
-
-    @property
-    def port_count(self):
-        return self._port_count
+        return self._ports.__iter__()
 
     def reset(self):
         for port in self:
             port.uninitialize()
 
+    def configure_all(self, configs):
+        """Configure every port in one pass
+
+        @param configs: port configurations indexed by port id, None for ports that should not be configured"""
+        return [port.configure(configs[port.id]) for port in self]
+
     def _set_port_type(self, port, port_type): raise NotImplementedError
 
     def configure_port(self, port, config) -> PortDriver:
@@ -102,45 +141,76 @@ class PortHandler:
         else:
             driver = config['driver'](port, config['config'])
 
-        self._set_port_type(port.id, self._types[driver.driver])
+        port_type = self._types[driver.driver]
+        # the MCU only loses port types by resetting, which also sets them to not configured
+        # so setting an unconfigured port to not configured again is not needed
+        if config is not None or self._applied_types.get(port.id) != port_type:
+            self._set_port_type(port.id, port_type)
+            self._applied_types[port.id] = port_type
         driver.on_port_type_set()
 
         return driver
 
 
 class PortInstance:
-    props = ['log', '_port_idx', '_configurator', '_interface', '_driver', '_config_changed_callbacks']
+    props = ['log', 'id', 'interface', '_configurator', '_driver', '_driver_methods',
+             '_config_changed_callbacks', '_notified_config']
 
     def __init__(self, port_idx, name, interface: RevvyControl, configurator):
         self.log = get_logger(f'{name} {port_idx}')
-        self._port_idx = port_idx
+        self.id = port_idx
+        self.interface = interface
         self._configurator = configurator
-        self._interface = interface
         self._driver = None
+        self._driver_methods = []
         self._config_changed_callbacks = FunctionAggregator()
-
-    @property
-    def id(self):
-        return self._port_idx
-
-    @property
-    def interface(self):
-        return self._interface
+        self._notified_config = None
 
     @property
     def on_config_changed(self):
         return self._config_changed_callbacks
 
+    def _notify_config_changed(self, config):
+        # listeners already know about this configuration, e.g. a port that was reset and is now being configured
+        if config is self._notified_config:
+            return
+        self._notified_config = config
+        self._config_changed_callbacks(self, config)
+
     def _configure(self, config):
         # temporarily disable reading port
-        self._config_changed_callbacks(self, None)
+        self._notify_config_changed(None)
         if self._driver:
             self._driver.uninitialize()
+        self._unbind_driver_methods()
         self._driver = self._configurator(self, config)
-        self._config_changed_callbacks(self, config)
+        self._bind_driver_methods()
+        self._notify_config_changed(config)
 
         return self._driver
 
+    def _bind_driver_methods(self):
+        """Copy the public methods of the driver into the instance so they are found without calling __getattr__
+
+        Properties are not copied because their values change, they are still resolved by __getattr__"""
+        driver = self._driver
+        driver_type = type(driver)
+        for name in dir(driver):
+            if name.startswith('_') or name in self.props or hasattr(PortInstance, name):
+                continue
+            if isinstance(getattr(driver_type, name, None), property):
+                continue
+
+            attribute = getattr(driver, name)
+            if callable(attribute):
+                self.__dict__[name] = attribute
+                self._driver_methods.append(name)
+
+    def _unbind_driver_methods(self):
+        for name in self._driver_methods:
+            del self.__dict__[name]
+        self._driver_methods.clear()
+
     def configure(self, config) -> PortDriver:
         self.log('Configure')
         return self._configure(config)
@@ -150,7 +220,10 @@ class PortInstance:
         self._configure(None)
 
     def __getattr__(self, name):
-        return getattr(self._driver, name)
+        driver = self._driver
+        if driver is None:
+            raise AttributeError(f'Port {self.id} is not configured, it has no attribute {name!r}')
+        return getattr(driver, name)
 
     def __setattr__(self, key, value):
         if key in self.props:
@@ -5,7 +5,17 @@ from functools import partial
 from revvy.robot.ports.common import PortInstance, PortDriver
 from revvy.robot.ports.motor import MotorConstants
 from revvy.utils.awaiter import AwaiterImpl, Awaiter
-from revvy.utils.functions import clip
+
+# precompiled formats of the motor control requests, status and configuration
+_pack_speed = struct.Struct('<f').pack
+_pack_speed_with_power_limit = struct.Struct('<ff').pack
+_pack_position = struct.Struct('<l').pack
+_pack_position_with_limit = struct.Struct('<lbf').pack
+_pack_position_with_limits = struct.Struct('<lff').pack
+_unpack_status = struct.Struct('<bblf').unpack
+# resolution, position controller (5), speed controller (5), acceleration limits (2), max current
+_pack_config = struct.Struct('<14f').pack
+_pack_linearity_point = struct.Struct('<ff').pack
 
 
 def motor_port_control_command(port_idx, *command_data):
@@ -15,17 +25,19 @@ def motor_port_control_command(port_idx, *command_data):
 
 
 def dc_motor_power_request(port_idx, power):
-    power = clip(power, -100, 100)
+    # clip(power, -100, 100), inlined
     if power < 0:
-        power = 256 + power
+        power = 256 + (power if power > -100 else -100)
+    elif power > 100:
+        power = 100
     return motor_port_control_command(port_idx, 0, power)
 
 
 def dc_motor_speed_request(port_idx, speed, power_limit=None):
     if power_limit is None:
-        control = struct.pack("<f", speed)
+        control = _pack_speed(speed)
     else:
-        control = struct.pack("<ff", speed, power_limit)
+        control = _pack_speed_with_power_limit(speed, power_limit)
 
     return motor_port_control_command(port_idx, 1, *control)
 
@@ -35,14 +47,14 @@ def dc_motor_position_request(port_idx, request_type, position, speed_limit=None
 
     if speed_limit is None:
         if power_limit is None:
-            control = struct.pack("<l", position)
+            control = _pack_position(position)
         else:
-            control = struct.pack("<lbf", position, 0, power_limit)
+            control = _pack_position_with_limit(position, 0, power_limit)
     else:
         if power_limit is None:
-            control = struct.pack("<lbf", position, 1, speed_limit)
+            control = _pack_position_with_limit(position, 1, speed_limit)
         else:
-            control = struct.pack("<lff", position, speed_limit, power_limit)
+            control = _pack_position_with_limits(position, speed_limit, power_limit)
 
     return motor_port_control_command(port_idx, request_type, *control)
 
@@ -85,17 +97,17 @@ class DcMotorController(PortDriver):
 
         resolution = self._port_config['encoder_resolution'] * self._port_config['gear_ratio']
 
-        config = [
-            *struct.pack("<f", resolution),
-            *struct.pack("<5f", posP, posI, posD, speedLowerLimit, speedUpperLimit),
-            *struct.pack("<5f", speedP, speedI, speedD, powerLowerLimit, powerUpperLimit),
-            *struct.pack("<ff", decMax, accMax),
-            *struct.pack("<f", max_current)
-        ]
-        for x, y in self._port_config.get('linearity', {}).items():
-            config += struct.pack('<ff', x, y)
+        # the packed bytes are sent as they are, there is no need to copy them into a list
+        config = _pack_config(resolution,
+                              posP, posI, posD, speedLowerLimit, speedUpperLimit,
+                              speedP, speedI, speedD, powerLowerLimit, powerUpperLimit,
+                              decMax, accMax,
+                              max_current)
+        linearity = self._port_config.get('linearity', {})
+        if linearity:
+            config += b''.join(_pack_linearity_point(x, y) for x, y in linearity.items())
 
-        self.log(f'Sending configuration: {config}')
+        self.log(f'Sending configuration: {config.hex()}')
 
         self._configure(config)
 
@@ -185,7 +197,7 @@ class DcMotorController(PortDriver):
 
     def update_status(self, data):
         if len(data) == 10:
-            status, self._power, self._pos, self._speed = struct.unpack('<bblf', data)
+            status, self._power, self._pos, self._speed = _unpack_status(data)
 
             self._update_motor_status(MotorStatus(status))
             self.on_status_changed(self._port)
@@ -3,7 +3,6 @@
 from collections import namedtuple
 from threading import Event
 
-from revvy.utils.activation import EdgeDetector
 from revvy.utils.stopwatch import Stopwatch
 from revvy.utils.thread_wrapper import ThreadWrapper, ThreadContext
 from revvy.utils.logger import get_logger
@@ -17,21 +16,19 @@ class RemoteController:
 
         self._analogActions = []  # ([channel], callback) pairs
         self._analogStates = []  # the last analog values, used to compare if a callback needs to be fired
-        self._buttonHandlers = [EdgeDetector() for _ in range(32)]
+        # the last button states, used to detect button presses
+        # initially every button is considered pressed so that buttons held at startup don't fire
+        self._buttonStates = [True] * 32
+        self._previousButtonStates = [True] * 32  # second buffer, swapped with _buttonStates when buttons change
         self._buttonActions = [None] * 32  # callbacks to be fired if a button gets pressed
 
-        for handler in self._buttonHandlers:
-            handler.handle(1)
-
     def reset(self):
         self._log('RemoteController: reset')
         self._analogActions.clear()
         self._analogStates.clear()
 
         self._buttonActions = [None] * 32
-
-        for handler in self._buttonHandlers:
-            handler.handle(1)
+        self._buttonStates = [True] * 32
 
     def tick(self, message: RemoteControllerCommand):
         # handle analog channels
@@ -50,12 +47,21 @@ class RemoteController:
                     # looks like an action was registered for an analog channel that we didn't receive
                     self._log(f'Skip analog handler for channels {", ".join(map(str, channels))}')
 
-        # handle button presses
-        for handler, button, action in zip(self._buttonHandlers, message.buttons, self._buttonActions):
-            pressed = handler.handle(button)
-            if pressed == 1 and action:
-                # noinspection PyCallingNonCallable
-                action()
+        # handle button presses, most messages don't change any button so compare them as a whole first
+        buttons = message.buttons
+        if buttons != self._buttonStates:
+            # copy into the spare buffer, the next message may reuse the received list
+            previous_button_states, button_states = self._buttonStates, self._previousButtonStates
+            # the buffers always hold 32 buttons, buttons missing from a short message keep their previous state
+            count = min(len(buttons), 32)
+            button_states[:count] = buttons[:count]
+            button_states[count:] = previous_button_states[count:]
+            self._buttonStates, self._previousButtonStates = button_states, previous_button_states
+
+            for previous, current, action in zip(previous_button_states, button_states, self._buttonActions):
+                if current > previous and action:
+                    # noinspection PyCallingNonCallable
+                    action()
 
     def on_button_pressed(self, button, action: callable):
         self._buttonActions[button] = action
@@ -65,7 +71,8 @@ class RemoteController:
 
 
 class RemoteControllerScheduler:
-
+    # [seconds] the controller is considered lost if no messages arrive in time
+    # longer timeouts tolerate a worse connection but the robot reacts slower to a lost controller
     first_message_timeout = 2
     message_max_period = 0.5
 
@@ -78,8 +85,11 @@ class RemoteControllerScheduler:
         self._log = get_logger('RemoteControllerScheduler')
 
     def data_ready(self, message: RemoteControllerCommand):
+        # Only the latest message is relevant, older ones are simply overwritten. The handler thread reads the message
+        # after clearing the event, so an already set event does not need to be set again (which would take its lock)
         self._message = message
-        self._data_ready_event.set()
+        if not self._data_ready_event.is_set():
+            self._data_ready_event.set()
 
     def _wait_for_message(self, ctx, wait_time):
         timeout = not self._data_ready_event.wait(wait_time)
@@ -101,11 +111,15 @@ class RemoteControllerScheduler:
             if self._controller_detected_callback:
                 self._controller_detected_callback()
 
-            self._controller.tick(self._message)
+            tick = self._controller.tick
+            wait_for_message = self._wait_for_message
+            message_max_period = self.message_max_period
+
+            tick(self._message)
 
             # wait for the other messages
-            while self._wait_for_message(ctx, self.message_max_period):
-                self._controller.tick(self._message)
+            while wait_for_message(ctx, message_max_period):
+                tick(self._message)
 
         if not ctx.stop_requested:
             if self._controller_lost_callback:
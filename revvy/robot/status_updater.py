@@ -61,10 +61,12 @@ class McuStatusUpdater:
         data = self._robot.status_updater_read()
 
         idx = 0
-        while idx < len(data):
+        data_length = len(data)
+        while idx < data_length:
+            # indexing bytes returns ints directly, no need to slice out the slot header
+            slot = data[idx]
             data_start = idx + 2
-            slot, slot_length = data[idx:data_start]
-            idx = data_start + slot_length
+            idx = data_start + data[idx + 1]
 
             handler = self._handlers[slot]
             if handler:
@@ -5,27 +5,23 @@ from json import JSONDecodeError
 
 from revvy.robot.configurations import Motors, Sensors
 from revvy.scripting.runtime import ScriptDescriptor
-from revvy.utils.functions import b64_decode_str, dict_get_first, str_to_func
+from revvy.utils.functions import b64_decode_str, str_to_func
 from revvy.scripting.builtin_scripts import builtin_scripts
 from revvy.utils.logger import get_logger
 
 _log = get_logger('RobotConfig')
 
-motor_types = [
-    None,
-    Motors.RevvyMotor,
-    # motor
-    [
-        [  # left
-            Motors.RevvyMotor_CCW,
-            Motors.RevvyMotor
-        ],
-        [  # right
-            Motors.RevvyMotor,
-            Motors.RevvyMotor_CCW
-        ]
-    ]
-]
+# (type, side, reversed) -> motor driver, side and reversed are only relevant for drivetrain motors
+motor_types = {
+    (0, None, None): None,
+    (1, None, None): Motors.RevvyMotor,
+    # drivetrain, left
+    (2, 0, 0): Motors.RevvyMotor_CCW,
+    (2, 0, 1): Motors.RevvyMotor,
+    # drivetrain, right
+    (2, 1, 0): Motors.RevvyMotor,
+    (2, 1, 1): Motors.RevvyMotor_CCW,
+}
 
 motor_sides = ["left", "right"]
 
@@ -38,7 +34,14 @@ sensor_types = [
 ]
 
 
+def _lowercase_keys(obj: dict):
+    """Canonicalize keys while parsing so both camelCase and lowercase configurations are accepted"""
+    return {key.lower(): value for key, value in obj.items()}
+
+
 class PortConfig:
+    __slots__ = ('_ports', '_port_names')
+
     def __init__(self):
         self._ports = {}
         self._port_names = {}
@@ -55,6 +58,8 @@ class PortConfig:
 
 
 class RemoteControlConfig:
+    __slots__ = ('analog', 'buttons')
+
     def __init__(self):
         self.analog = []
         self.buttons = [None] * 32
@@ -67,40 +72,38 @@ class ConfigError(Exception):
 class RobotConfig:
     @staticmethod
     def create_runnable(script):
-        try:
-            script_name = dict_get_first(script, ['builtinScriptName', 'builtinscriptname'])
+        if 'builtinscriptname' in script:
+            script_name = script['builtinscriptname']
             _log(f'Use builtin script: {script_name}')
 
-            try:
+            if script_name in builtin_scripts:
                 return builtin_scripts[script_name]
-            except KeyError as e:
-                raise KeyError(f'Builtin script "{script_name}" does not exist') from e
 
-        except KeyError:
-            try:
-                source_b64_encoded = dict_get_first(script, ['pythonCode', 'pythoncode'])
-                code = b64_decode_str(source_b64_encoded)
-                _log(f'Use python code as script: {code}')
+            # fall back to python code if it is present
+            _log(f'Builtin script "{script_name}" does not exist')
+
+        if 'pythoncode' in script:
+            code = b64_decode_str(script['pythoncode'])
+            _log(f'Use python code as script: {code}')
 
-                code = code.replace('import time\n', '')
+            code = code.replace('import time\n', '')
 
-                return str_to_func(code)
+            return str_to_func(code)
 
-            except KeyError as e:
-                raise KeyError('Neither builtinScriptName, nor pythonCode is present for a script') from e
+        raise KeyError('Neither builtinScriptName, nor pythonCode is present for a script')
 
     @staticmethod
     def from_string(config_string):
         try:
-            json_config = json.loads(config_string)
+            json_config = json.loads(config_string, object_hook=_lowercase_keys)
         except JSONDecodeError as e:
             raise ConfigError('Received configuration is not a valid json string') from e
 
         config = RobotConfig()
         try:
-            robot_config = dict_get_first(json_config, ['robotConfig', 'robotconfig'])
-            blockly_list = dict_get_first(json_config, ['blocklyList', 'blocklylist'])
-        except KeyError as e:
+            robot_config = json_config['robotconfig']
+            blockly_list = json_config['blocklylist']
+        except (TypeError, KeyError) as e:
             raise ConfigError('Received configuration is missing required parts') from e
 
         try:
@@ -113,11 +116,11 @@ class RobotConfig:
                 # script names are mostly relevant for logging
                 if 'analog' in assignments:
                     for analog_assignment in assignments['analog']:
-                        channels = ', '.join(map(str, analog_assignment['channels']))
-                        script_name = f'[script {i}] analog channels {channels}'
+                        channels = analog_assignment['channels']
+                        script_name = f'[script {i}] analog channels {", ".join(map(str, channels))}'
                         priority = analog_assignment['priority']
                         config.controller.analog.append({
-                            'channels': analog_assignment['channels'],
+                            'channels': channels,
                             'script': ScriptDescriptor(script_name, runnable, priority)})
                         i += 1
 
@@ -146,11 +149,12 @@ class RobotConfig:
 
                 if motor['type'] == 2:
                     # drivetrain
-                    motor_type = motor_types[2][motor['side']][motor['reversed']]
-                    config.drivetrain[motor_sides[motor['side']]].append(i)
+                    side = motor['side']
+                    motor_type = motor_types[(2, side, motor['reversed'])]
+                    config.drivetrain[motor_sides[side]].append(i)
 
                 else:
-                    motor_type = motor_types[motor['type']]
+                    motor_type = motor_types[(motor['type'], None, None)]
 
                 if motor_type is not None:
                     config.motors.names[motor['name']] = i
@@ -2,8 +2,6 @@
 import struct
 import time
 
-from math import sqrt, sin, cos, pi, atan2
-
 from revvy.scripting.robot_interface import DriveTrainWrapper, SensorPortWrapper
 from revvy.utils.functions import map_values
 
@@ -36,17 +34,12 @@ def joystick(x, y):
     (-1.0, 1.0)
     """
 
-    if x == y == 0:
-        return 0.0, 0.0
-
-    angle = atan2(y, x) - pi / 2
-    length = sqrt(x * x + y * y)
-
-    v = length * cos(angle)
-    w = length * sin(angle)
-
-    sr = round(v + w, 3)
-    sl = round(v - w, 3)
+    # The control vector is rotated by -90 degrees, so
+    #   v = length * cos(angle - pi / 2) = length * sin(angle) = y
+    #   w = length * sin(angle - pi / 2) = -length * cos(angle) = -x
+    # and the wheel speeds can be calculated without trigonometric functions
+    sr = float(round(y - x, 3))
+    sl = float(round(y + x, 3))
     return sl, sr
 
 
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: GPL-3.0-only
+import hashlib
+import io
+import lzma
+import os
+import shutil
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from threading import BoundedSemaphore
+
+from revvy.bluetooth.longmessage import LongMessageType, LongMessageStatus, bytes2hexdigest
+from revvy.utils.file_storage import IntegrityError
+
+try:
+    # ISA-L provides a considerably faster inflate implementation, it is used when installed on the robot
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# tarfile reads the archive in 512 byte blocks, read the underlying buffer in larger chunks
+ASSET_READ_BUFFER_SIZE = 256 * 1024
+
+# files are written by a small pool so that slow flash writes overlap with decompressing the next member
+ASSET_WRITER_THREADS = 3
+ASSET_MAX_PENDING_WRITES = 8
+
+
+class _HashingReader(io.RawIOBase):
+    """Calculate the md5 checksum of the data while it is read from the wrapped stream"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._hash = hashlib.md5()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        read = self._stream.readinto(buffer)
+        if read:
+            self._hash.update(memoryview(buffer)[:read])
+        return read
+
+    def digest(self):
+        return self._hash.digest()
+
+
+def _is_within_directory(directory, target):
+    abs_directory = os.path.abspath(directory)
+    abs_target = os.path.abspath(target)
+
+    return os.path.commonprefix([abs_directory, abs_target]) == abs_directory
+
+
+def _open_decompressed(stream: io.BufferedReader):
+    """Detect the compression format from the magic bytes of the stream and return a decompressed stream"""
+    magic = stream.peek(6)[:6]
+
+    if magic.startswith(b'\x1f\x8b'):
+        return gzip.open(stream, 'rb')
+    elif magic.startswith(b'\xfd7zXZ\x00'):
+        return lzma.open(stream, 'rb')
+    elif magic.startswith(b'\x28\xb5\x2f\xfd'):
+        if zstandard is None:
+            raise ValueError('zstd compressed archive can not be decompressed, zstandard is not installed')
+        return zstandard.ZstdDecompressor().stream_reader(stream)
+    else:
+        # assume uncompressed tar
+        return stream
+
+
+def _write_asset_file(path, data, mode):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as asset_file:
+        asset_file.write(data)
+    os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def _extract_tar(tar: tarfile.TarFile, path):
+    """Extract the members of the tar file sequentially read from the archive, writing regular files in parallel"""
+    with ThreadPoolExecutor(max_workers=ASSET_WRITER_THREADS) as writers:
+        # limit the number of files held in memory waiting to be written
+        pending_writes = BoundedSemaphore(ASSET_MAX_PENDING_WRITES)
+        writes = []
+
+        for member in tar:
+            member_path = os.path.join(path, member.name)
+            if not _is_within_directory(path, member_path):
+                raise Exception("Attempted Path Traversal in Tar File")
+
+            if member.isreg():
+                data = tar.extractfile(member).read()
+
+                pending_writes.acquire()
+                write = writers.submit(_write_asset_file, member_path, data, member.mode & 0o777)
+                write.add_done_callback(lambda _: pending_writes.release())
+                writes.append(write)
+            elif member.isdir():
+                tar.extract(member, path)
+            else:
+                # links may refer to files that are still waiting to be written and the stream can not be read
+                # backwards to extract them again, so wait for the pending writes first
+                for write in writes:
+                    write.result()
+                writes.clear()
+
+                tar.extract(member, path)
+
+        # raise errors that happened while writing
+        for write in writes:
+            write.result()
+
+
+def _read_asset_marker(path):
+    if not os.path.isfile(path):
+        return None
+
+    with open(path, 'r') as marker_file:
+        return marker_file.read()
+
+
+def _write_asset_marker(path, value):
+    """Write the marker file atomically so an interrupted write never leaves a valid-looking marker"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as marker_file:
+        marker_file.write(value)
+    os.replace(tmp_path, path)
+
+
+def extract_asset_longmessage(storage, asset_dir):
+    """
+    Extract the ASSET_DATA long message into a folder.
+
+    After successfully extracting, store the checksum and length of the asset message in the .hash and .hash.size
+    files. Skip extracting if the long message has the same checksum and length as stored in the folder.
+    The folder will be deleted if exists before decompression. The checksum of the message is verified while it is
+    extracted, the folder is deleted and IntegrityError is raised if it does not match.
+
+    @param storage: the source where the asset data message is stored
+    @param asset_dir: the destination directory
+    """
+
+    asset_status = storage.read_status(LongMessageType.ASSET_DATA)
+
+    if asset_status.status == LongMessageStatus.READY:
+        hash_file = os.path.join(asset_dir, '.hash')
+        size_file = os.path.join(asset_dir, '.hash.size')
+
+        asset_hash = bytes2hexdigest(asset_status.md5)
+        asset_size = str(asset_status.length)
+
+        if _read_asset_marker(hash_file) == asset_hash and _read_asset_marker(size_file) == asset_size:
+            return
+
+        if os.path.isdir(asset_dir):
+            shutil.rmtree(asset_dir)
+
+        # the archive is decompressed and extracted while it is read, the message is never loaded into memory
+        with storage.open_long_message(LongMessageType.ASSET_DATA) as message_data, \
+                _HashingReader(message_data) as hashed_data, \
+                io.BufferedReader(hashed_data, buffer_size=ASSET_READ_BUFFER_SIZE) as buffered_data, \
+                _open_decompressed(buffered_data) as decompressed_data, \
+                tarfile.open(fileobj=decompressed_data, mode="r|") as tar:
+            _extract_tar(tar, asset_dir)
+
+            # reading stops at the end of the archive, read the rest of the message so that all of it is checked
+            while buffered_data.read(ASSET_READ_BUFFER_SIZE):
+                pass
+
+            asset_digest = hashed_data.digest()
+
+        if asset_digest != asset_status.md5:
+            shutil.rmtree(asset_dir, ignore_errors=True)
+            raise IntegrityError('Checksum')
+
+        # the hash is written last, so a partially extracted folder is never considered up to date
+        _write_asset_marker(size_file, asset_size)
+        _write_asset_marker(hash_file, asset_hash)
@@ -1,6 +1,5 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import os
-import traceback
 from collections import defaultdict
 
 from revvy.utils.functions import read_json
@@ -35,7 +34,7 @@ class Assets:
             self._log(f'Asset source does not exist: {path}', LogLevel.WARNING)
         except Exception:
             self._log(f'Skip loading assets from {path} due to unexpected error', LogLevel.WARNING)
-            self._log(traceback.format_exc(), LogLevel.DEBUG)
+            self._log('Error details:', LogLevel.DEBUG, exc_info=True)
 
     def get_asset_file(self, category, name):
         return self._files[category][name]
@@ -1,5 +1,6 @@
 # SPDX-License-Identifier: GPL-3.0-only
 
+import io
 import os
 import json
 from json import JSONDecodeError
@@ -25,6 +26,7 @@ class StorageInterface:
     def read_metadata(self, filename): raise NotImplementedError
     def write(self, filename, data, metadata=None, md5=None): raise NotImplementedError
     def read(self, filename): raise NotImplementedError
+    def open(self, filename): raise NotImplementedError
 
 
 class MemoryStorageItem(NamedTuple):
@@ -65,6 +67,9 @@ class MemoryStorage(StorageInterface):
             raise IntegrityError('Checksum')
         return data
 
+    def open(self, name):
+        return io.BytesIO(self.read(name))
+
 
 class FileStorage(StorageInterface):
     """
@@ -136,6 +141,28 @@ class FileStorage(StorageInterface):
         except JSONDecodeError as e:
             raise IntegrityError('Metadata') from e
 
+    def open(self, filename):
+        """
+        Open the stored data as a binary stream.
+
+        Only the length is verified here, the checksum can only be verified by the reader
+        """
+        try:
+            metadata = self.read_metadata(filename)
+        except JSONDecodeError as e:
+            raise IntegrityError('Metadata') from e
+
+        try:
+            data_file = open(self._storage_file(filename), "rb")
+        except IOError as e:
+            raise StorageElementNotFoundError from e
+
+        if os.fstat(data_file.fileno()).st_size != metadata['length']:
+            data_file.close()
+            raise IntegrityError('Length')
+
+        return data_file
+
 
 def create_unique_file(base_filename):
 
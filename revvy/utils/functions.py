@@ -2,11 +2,13 @@
 
 import hashlib
 import json
+import re
 import traceback
 from binascii import b2a_base64, a2b_base64
 
 import math
 from contextlib import suppress
+from functools import lru_cache
 
 
 def clip(x, min_x, max_x):
@@ -42,6 +44,9 @@ def map_values(x, min_x, max_x, min_y, max_y):
     return (x - min_x) * (full_scale_out / full_scale_in) + min_y
 
 
+_cpuinfo_serial = re.compile('^Serial.*$', re.MULTILINE)
+
+
 def get_serial():
     """Extract serial from cpuinfo file"""
 
@@ -49,10 +54,9 @@ def get_serial():
     # noinspection PyBroadException
     try:
         with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line.startswith('Serial'):
-                    cpu_serial = line.rstrip()[-16:].lstrip('0')
-                    break
+            match = _cpuinfo_serial.search(f.read())
+        if match:
+            cpu_serial = match.group().rstrip()[-16:].lstrip('0')
     except Exception:
         print('Failed to read cpuid')
         print(traceback.format_exc())
@@ -63,8 +67,7 @@ def get_serial():
 
 def retry(fn, retries=5):
     """Retry the given function a number of times, or until it returns True or None"""
-    retry_num = 0
-    while retry_num < retries:
+    for _ in range(retries):
         # noinspection PyBroadException
         try:
             status = fn()
@@ -74,7 +77,6 @@ def retry(fn, retries=5):
                 return status
         except Exception:
             print(traceback.format_exc())
-        retry_num += 1
 
     return False
 
@@ -198,5 +200,11 @@ def str_to_func(code):
     Called with something
     """
     def wrapper(**kwargs):
-        exec(code, kwargs)
+        exec(_compile_script(code), kwargs)
     return wrapper
+
+
+@lru_cache(maxsize=64)
+def _compile_script(code):
+    """Compile script source once, identical scripts share the code object across runs and configurations"""
+    return compile(code, '<string>', 'exec')
@@ -1,3 +1,4 @@
+import traceback
 from collections import deque
 from threading import Lock
 
@@ -22,7 +23,7 @@ levels = (
 
 
 class BaseLogger:
-    def log(self, message, level):
+    def log(self, message, level, exc_info=False):
         pass
 
     def flush(self):
@@ -36,8 +37,12 @@ class Logger(BaseLogger):
         self.minimum_level = LogLevel.INFO
         self.on_flush = None
 
-    def log(self, message, level=LogLevel.INFO):
+    def log(self, message, level=LogLevel.INFO, exc_info=False):
+        """Log a message. If exc_info is set, the traceback of the current exception is appended to the message,
+        but it is only formatted if the message is actually logged"""
         if level >= self.minimum_level:
+            if exc_info:
+                message = f'{message}\n{traceback.format_exc()}'
             message = f'[{self._sw.elapsed:.2f}][{levels[level]}] {message}'
             print(message)
             self._buffer.append(message + '\n')
@@ -54,14 +59,14 @@ class LogWrapper(BaseLogger):
         self._logger = logger
         self._default_log_level = default_log_level
 
-    def log(self, message, level=None):
+    def log(self, message, level=None, exc_info=False):
         message = self._tag + message
         if level is None:
             level = self._default_log_level
-        self._logger.log(message, level)
+        self._logger.log(message, level, exc_info)
 
-    def __call__(self, message, level=None):
-        self.log(message, level)
+    def __call__(self, message, level=None, exc_info=False):
+        self.log(message, level, exc_info)
 
     def flush(self):
         self._logger.flush()
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: GPL-3.0-only
+
+import gzip
+import io
+import lzma
+import os
+import tarfile
+import tempfile
+import time
+import unittest
+
+from mock import patch
+
+from revvy.bluetooth.longmessage import LongMessageStorage, LongMessageType
+from revvy.utils import asset_extractor
+from revvy.utils.asset_extractor import extract_asset_longmessage
+from revvy.utils.file_storage import MemoryStorage, FileStorage, IntegrityError
+
+
+def create_tar(files):
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode='w') as tar:
+        for name, content in files.items():
+            member = tarfile.TarInfo(name)
+            member.size = len(content)
+            tar.addfile(member, io.BytesIO(content))
+
+    return archive.getvalue()
+
+
+def create_storage(message_data):
+    storage = MemoryStorage()
+    storage.write(LongMessageType.ASSET_DATA, message_data)
+
+    return LongMessageStorage(storage, MemoryStorage())
+
+
+def read_file(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TestExtractAssetLongMessage(unittest.TestCase):
+    def setUp(self):
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.asset_dir = os.path.join(self._temp_dir.name, 'assets')
+
+    def tearDown(self):
+        self._temp_dir.cleanup()
+
+    def _asset_path(self, *path):
+        return os.path.join(self.asset_dir, *path)
+
+    def test_missing_message_is_not_extracted(self):
+        extract_asset_longmessage(LongMessageStorage(MemoryStorage(), MemoryStorage()), self.asset_dir)
+
+        self.assertFalse(os.path.exists(self.asset_dir))
+
+    def test_gzip_compressed_archive_is_extracted(self):
+        archive = gzip.compress(create_tar({'assets.json': b'{}', 'sounds/beep.mp3': b'beep'}))
+        extract_asset_longmessage(create_storage(archive), self.asset_dir)
+
+        self.assertEqual(b'{}', read_file(self._asset_path('assets.json')))
+        self.assertEqual(b'beep', read_file(self._asset_path('sounds', 'beep.mp3')))
+
+    def test_xz_compressed_archive_is_extracted(self):
+        archive = lzma.compress(create_tar({'assets.json': b'{}', 'sounds/beep.mp3': b'beep'}))
+        extract_asset_longmessage(create_storage(archive), self.asset_dir)
+
+        self.assertEqual(b'{}', read_file(self._asset_path('assets.json')))
+        self.assertEqual(b'beep', read_file(self._asset_path('sounds', 'beep.mp3')))
+
+    def test_uncompressed_archive_is_extracted(self):
+        archive = create_tar({'assets.json': b'{}', 'sounds/beep.mp3': b'beep'})
+        extract_asset_longmessage(create_storage(archive), self.asset_dir)
+
+        self.assertEqual(b'{}', read_file(self._asset_path('assets.json')))
+        self.assertEqual(b'beep', read_file(self._asset_path('sounds', 'beep.mp3')))
+
+    def test_hard_links_are_extracted(self):
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode='w:gz') as tar:
+            for name in ['a.bin', 'c.bin']:
+                member = tarfile.TarInfo(name)
+                member.size = 4
+                tar.addfile(member, io.BytesIO(b'data'))
+
+            link = tarfile.TarInfo('b.bin')
+            link.type = tarfile.LNKTYPE
+            link.linkname = 'a.bin'
+            tar.addfile(link)
+
+        write_asset_file = asset_extractor._write_asset_file
+
+        def slow_write(*args):
+            # the link target must not be on the disk yet when the link is reached
+            time.sleep(0.1)
+            write_asset_file(*args)
+
+        with patch('revvy.utils.asset_extractor._write_asset_file', slow_write):
+            extract_asset_longmessage(create_storage(archive.getvalue()), self.asset_dir)
+
+        self.assertEqual(b'data', read_file(self._asset_path('b.bin')))
+        self.assertEqual(b'data', read_file(self._asset_path('c.bin')))
+
+    def test_hash_and_size_are_stored_after_extracting(self):
+        archive = gzip.compress(create_tar({'assets.json': b'{}'}))
+        storage = create_storage(archive)
+        extract_asset_longmessage(storage, self.asset_dir)
+
+        metadata = storage.read_status(LongMessageType.ASSET_DATA)
+        self.assertEqual(metadata.md5.hex(), read_file(self._asset_path('.hash')).decode())
+        self.assertEqual(str(len(archive)), read_file(self._asset_path('.hash.size')).decode())
+
+    def test_extracting_is_skipped_if_hash_and_size_match(self):
+        storage = create_storage(gzip.compress(create_tar({'assets.json': b'{}'})))
+        extract_asset_longmessage(storage, self.asset_dir)
+
+        os.remove(self._asset_path('assets.json'))
+        extract_asset_longmessage(storage, self.asset_dir)
+
+        self.assertFalse(os.path.exists(self._asset_path('assets.json')))
+
+    def test_archive_is_extracted_again_if_a_marker_differs_or_is_missing(self):
+        storage = create_storage(gzip.compress(create_tar({'assets.json': b'{}'})))
+
+        for marker in ['.hash', '.hash.size']:
+            with self.subTest(marker=marker, case='differs'):
+                extract_asset_longmessage(storage, self.asset_dir)
+                os.remove(self._asset_path('assets.json'))
+                with open(self._asset_path(marker), 'w') as marker_file:
+                    marker_file.write('0')
+
+                extract_asset_longmessage(storage, self.asset_dir)
+                self.assertEqual(b'{}', read_file(self._asset_path('assets.json')))
+
+            with self.subTest(marker=marker, case='missing'):
+                os.remove(self._asset_path('assets.json'))
+                os.remove(self._asset_path(marker))
+
+                extract_asset_longmessage(storage, self.asset_dir)
+                self.assertEqual(b'{}', read_file(self._asset_path('assets.json')))
+
+    def test_old_files_are_removed_when_extracting_again(self):
+        extract_asset_longmessage(create_storage(create_tar({'old.json': b'{}'})), self.asset_dir)
+        extract_asset_longmessage(create_storage(create_tar({'new.json': b'{}'})), self.asset_dir)
+
+        self.assertFalse(os.path.exists(self._asset_path('old.json')))
+        self.assertTrue(os.path.exists(self._asset_path('new.json')))
+
+    def test_path_traversal_is_rejected(self):
+        storage = create_storage(gzip.compress(create_tar({'../evil.json': b'{}'})))
+
+        self.assertRaises(Exception, lambda: extract_asset_longmessage(storage, self.asset_dir))
+        self.assertFalse(os.path.exists(os.path.join(self._temp_dir.name, 'evil.json')))
+        self.assertFalse(os.path.exists(self._asset_path('.hash')))
+
+    def _corrupted_storage(self, message_data, position):
+        storage = FileStorage(os.path.join(self._temp_dir.name, 'ble'))
+        storage.write(LongMessageType.ASSET_DATA, message_data)
+
+        # flip a byte of the stored data, keeping its length
+        with open(os.path.join(self._temp_dir.name, 'ble', f'{LongMessageType.ASSET_DATA}.data'), 'r+b') as data_file:
+            data_file.seek(position)
+            byte = data_file.read(1)
+            data_file.seek(position)
+            data_file.write(bytes([byte[0] ^ 0xFF]))
+
+        return LongMessageStorage(storage, MemoryStorage())
+
+    def test_archive_with_wrong_checksum_is_rejected(self):
+        # the first byte of the content of assets.json
+        storage = self._corrupted_storage(create_tar({'assets.json': b'{}'}), 512)
+
+        self.assertRaises(IntegrityError, lambda: extract_asset_longmessage(storage, self.asset_dir))
+        self.assertFalse(os.path.exists(self.asset_dir))
+
+    def test_unused_part_of_the_message_is_also_checked(self):
+        # the padding after the end of archive marker is not needed by the extractor, but it still needs to be checked
+        message_data = create_tar({'assets.json': b'{}'})
+        storage = self._corrupted_storage(message_data, len(message_data) - 1)
+
+        self.assertRaises(IntegrityError, lambda: extract_asset_longmessage(storage, self.asset_dir))
+        self.assertFalse(os.path.exists(self.asset_dir))
@@ -2,6 +2,7 @@
 
 import json
 import os
+import tempfile
 import unittest
 from mock.mock import patch, mock_open
 
@@ -41,6 +42,18 @@ class TestMemoryStorage(unittest.TestCase):
         storage.write('foo', b'data', md5='foobar')
         self.assertRaises(IntegrityError, lambda: storage.read('foo'))
 
+    def test_stored_data_can_be_opened_as_stream(self):
+        storage = MemoryStorage()
+
+        storage.write('foo', b'data')
+        with storage.open('foo') as stream:
+            self.assertEqual(b'data', stream.read())
+
+    def test_opening_missing_item_raises_error(self):
+        storage = MemoryStorage()
+
+        self.assertRaises(StorageElementNotFoundError, lambda: storage.open('foo'))
+
 
 class TestFileStorage(unittest.TestCase):
     @patch('revvy.utils.file_storage.open', new_callable=mock_open)
@@ -101,3 +114,40 @@ class TestFileStorage(unittest.TestCase):
 
         meta = storage.read_metadata('file')
         self.assertDictEqual({'md5': 'md5', 'length': 4}, meta)
+
+    def test_stored_data_can_be_opened_as_stream(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            storage = FileStorage(storage_dir)
+            storage.write('file', b'data')
+
+            with storage.open('file') as stream:
+                self.assertEqual(b'data', stream.read())
+
+    def test_opening_raises_if_meta_or_data_file_not_found(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            storage = FileStorage(storage_dir)
+            self.assertRaises(StorageElementNotFoundError, lambda: storage.open('file'))
+
+            storage.write('file', b'data')
+            os.remove(os.path.join(storage_dir, 'file.data'))
+            self.assertRaises(StorageElementNotFoundError, lambda: storage.open('file'))
+
+    def test_opening_raises_if_length_does_not_match(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            storage = FileStorage(storage_dir)
+            storage.write('file', b'data')
+
+            with open(os.path.join(storage_dir, 'file.data'), 'wb') as data_file:
+                data_file.write(b'dat')
+
+            self.assertRaises(IntegrityError, lambda: storage.open('file'))
+
+    def test_opening_raises_if_metadata_is_invalid(self):
+        with tempfile.TemporaryDirectory() as storage_dir:
+            storage = FileStorage(storage_dir)
+            storage.write('file', b'data')
+
+            with open(os.path.join(storage_dir, 'file.meta'), 'w') as meta_file:
+                meta_file.write('{"md5":')
+
+            self.assertRaises(IntegrityError, lambda: storage.open('file'))
@@ -3,7 +3,7 @@
 import unittest
 from mock.mock import Mock, patch, mock_open
 
-from revvy.utils.functions import retry, get_serial
+from revvy.utils.functions import retry, get_serial, str_to_func
 
 
 class TestRetry(unittest.TestCase):
@@ -41,3 +41,17 @@ class TestGetSerial(unittest.TestCase):
         mock_file.side_effect = IOError
         serial = get_serial()
         self.assertEqual(serial, 'ERROR000000000')
+
+
+class TestStrToFunc(unittest.TestCase):
+    def test_script_is_compiled_once(self):
+        with patch('revvy.utils.functions.compile', create=True, side_effect=compile) as mock_compile:
+            func = str_to_func('mock(x)  # test_script_is_compiled_once')
+            mock = Mock()
+
+            func(mock=mock, x=1)
+            func(mock=mock, x=2)
+            str_to_func('mock(x)  # test_script_is_compiled_once')(mock=mock, x=3)
+
+            self.assertEqual(1, mock_compile.call_count)
+            self.assertEqual([((1,),), ((2,),), ((3,),)], mock.call_args_list)
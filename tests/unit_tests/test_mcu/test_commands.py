@@ -80,6 +80,37 @@ class TestCommand(unittest.TestCase):
         self.assertRaises(ValueError, c)
         self.assertRaises(ValueError, c)
 
+    def test_cached_command_is_only_sent_once(self):
+        mock_transport = MockTransport([Response(ResponseStatus.Ok, b'\x01\x06foobar')])
+        read_types = ReadMotorPortTypesCommand(mock_transport, cache_response=True)
+
+        self.assertDictEqual({'foobar': 1}, dict(read_types()))
+        self.assertDictEqual({'foobar': 1}, dict(read_types()))
+        self.assertEqual(1, mock_transport.command_count)
+
+    def test_cached_dict_response_can_not_be_modified(self):
+        mock_transport = MockTransport([Response(ResponseStatus.Ok, b'\x01\x06foobar')])
+        read_types = ReadMotorPortTypesCommand(mock_transport, cache_response=True)
+
+        types = read_types()
+
+        def modify():
+            types['baz'] = 2
+
+        self.assertRaises(TypeError, modify)
+
+    def test_invalid_response_is_not_cached(self):
+        mock_transport = MockTransport([
+            Response(ResponseStatus.Ok, b'v0.1'),
+            Response(ResponseStatus.Ok, b'0.1')
+        ])
+        hw = ReadHardwareVersionCommand(mock_transport, cache_response=True)
+
+        self.assertEqual(None, hw())
+        self.assertEqual(Version("0.1"), hw())
+        self.assertEqual(Version("0.1"), hw())
+        self.assertEqual(2, mock_transport.command_count)
+
 
 # noinspection PyTypeChecker
 class TestCommandTypes(unittest.TestCase):
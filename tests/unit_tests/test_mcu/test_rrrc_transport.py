@@ -89,6 +89,18 @@ class TestRevvyTransport(unittest.TestCase):
         self.assertEqual(ResponseStatus.Ok, response.status)
         self.assertEqual(0, len(response.payload))
 
+    def test_frames_without_payload_are_reused(self):
+        mock_interface = MockInterface([
+            [ResponseStatus.Ok.value, 0, 0xFF, 0xFF, 117],
+            [ResponseStatus.Ok.value, 0, 0xFF, 0xFF, 117]
+        ])
+        rt = RevvyTransport(mock_interface)
+        rt.send_command(10)
+        rt.send_command(10)
+
+        self.assertEqual(Command.start(10, b''), mock_interface._writes[0][1])
+        self.assertIs(mock_interface._writes[0][1], mock_interface._writes[1][1])
+
     def test_retry_reading_after_busy_response(self):
         mock_interface = MockInterface([
             [ResponseStatus.Busy.value, 0, 0xFF, 0xFF, 118],
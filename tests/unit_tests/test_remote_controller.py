@@ -31,6 +31,34 @@ class TestRemoteController(unittest.TestCase):
                 self.assertEqual(mocks[j].call_count, 1 if i == j else 0)
                 mocks[j].reset_mock()
 
+    def test_buttons_held_at_start_are_not_pressed(self):
+        rc = RemoteController()
+        mock = Mock()
+        rc.on_button_pressed(3, mock)
+
+        buttons = [True] * 32
+        rc.tick(RemoteControllerCommand(buttons=buttons, analog=[0] * 10))
+        self.assertEqual(0, mock.call_count)
+
+        buttons[3] = False
+        rc.tick(RemoteControllerCommand(buttons=buttons, analog=[0] * 10))
+        buttons[3] = True
+        rc.tick(RemoteControllerCommand(buttons=buttons, analog=[0] * 10))
+        self.assertEqual(1, mock.call_count)
+
+    def test_short_button_message_does_not_hide_later_presses(self):
+        rc = RemoteController()
+        mock = Mock()
+        rc.on_button_pressed(31, mock)
+
+        rc.tick(RemoteControllerCommand(buttons=[False] * 32, analog=[0] * 10))
+        rc.tick(RemoteControllerCommand(buttons=[False] * 8, analog=[0] * 10))
+
+        buttons = [False] * 32
+        buttons[31] = True
+        rc.tick(RemoteControllerCommand(buttons=buttons, analog=[0] * 10))
+        self.assertEqual(1, mock.call_count)
+
     def test_requested_channels_are_passed_to_analog_handlers(self):
         rc = RemoteController()
         mock24 = Mock()
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: GPL-3.0-only
+
+import unittest
+
+from mock import Mock
+
+from revvy.robot.ports.common import FunctionAggregator, PortInstance
+
+
+class TestFunctionAggregator(unittest.TestCase):
+    def test_calling_empty_aggregator_does_nothing(self):
+        aggregator = FunctionAggregator()
+
+        aggregator('foo')
+
+    def test_all_callbacks_are_called_with_arguments(self):
+        aggregator = FunctionAggregator()
+        first = Mock()
+        second = Mock()
+
+        aggregator.add(first)
+        aggregator.add(second)
+        aggregator('foo', bar='baz')
+
+        first.assert_called_once_with('foo', bar='baz')
+        second.assert_called_once_with('foo', bar='baz')
+
+    def test_callback_can_remove_itself(self):
+        aggregator = FunctionAggregator()
+        second = Mock()
+
+        def first():
+            aggregator.remove(first)
+
+        aggregator.add(first)
+        aggregator.add(second)
+
+        aggregator()
+        aggregator()
+
+        self.assertEqual(2, second.call_count)
+
+    def test_callback_is_only_registered_once(self):
+        aggregator = FunctionAggregator()
+        callback = Mock()
+
+        token = aggregator.add(callback)
+        aggregator.add(callback)
+        aggregator()
+        self.assertEqual(1, callback.call_count)
+
+        aggregator.remove(token)
+        aggregator()
+        self.assertEqual(1, callback.call_count)
+
+
+class TestPortInstance(unittest.TestCase):
+    def test_config_changes_are_only_notified_once(self):
+        port = PortInstance(1, 'Test', Mock(), Mock())
+        callback = Mock()
+        port.on_config_changed.add(callback)
+
+        config = {'driver': 'foo'}
+        port.configure(None)
+        self.assertEqual(0, callback.call_count)
+
+        port.configure(config)
+        self.assertEqual([((port, config),)], callback.call_args_list)
+
+        callback.reset_mock()
+        port.configure(config)
+        self.assertEqual([((port, None),), ((port, config),)], callback.call_args_list)
+
+        callback.reset_mock()
+        port.uninitialize()
+        port.uninitialize()
+        self.assertEqual([((port, None),)], callback.call_args_list)
+
+    def test_unconfigured_port_has_no_driver_attributes(self):
+        port = PortInstance(1, 'Test', Mock(), Mock())
+
+        self.assertRaises(AttributeError, lambda: port.set_power)
@@ -61,6 +61,52 @@ class TestMotorPortHandler(unittest.TestCase):
         self.assertRaises(KeyError, lambda: ports[1].configure({"driver": TestDriver, "config": {}}))
         self.assertEqual(0, mock_control.set_motor_port_type.call_count)
 
+    def test_not_configured_port_type_is_only_sent_once(self):
+        mock_control = Mock()
+        mock_control.get_motor_port_amount = Mock(return_value=6)
+        mock_control.get_motor_port_types = Mock(return_value={"NotConfigured": 0, "DcMotor": 1})
+        mock_control.set_motor_port_type = Mock()
+
+        ports = create_motor_port_handler(mock_control)
+
+        ports[1].configure(None)
+        ports[1].configure(None)
+        self.assertEqual([call(1, 0)], mock_control.set_motor_port_type.call_args_list)
+
+        ports[1].configure({"driver": DcMotorController, "config": TestDcMotorDriver.config})
+        ports[1].configure(None)
+        self.assertEqual([call(1, 0), call(1, 1), call(1, 0)], mock_control.set_motor_port_type.call_args_list)
+
+    def test_configure_all_configures_every_port(self):
+        mock_control = Mock()
+        mock_control.get_motor_port_amount = Mock(return_value=2)
+        mock_control.get_motor_port_types = Mock(return_value={"NotConfigured": 0, "DcMotor": 1})
+        mock_control.set_motor_port_type = Mock()
+
+        ports = create_motor_port_handler(mock_control)
+
+        drivers = ports.configure_all({1: None, 2: {"driver": DcMotorController, "config": TestDcMotorDriver.config}})
+
+        self.assertEqual(2, len(drivers))
+        self.assertIs(DcMotorController, type(drivers[1]))
+        self.assertEqual([call(1, 0), call(2, 1)], mock_control.set_motor_port_type.call_args_list)
+
+    def test_port_methods_follow_the_configured_driver(self):
+        mock_control = Mock()
+        mock_control.get_motor_port_amount = Mock(return_value=6)
+        mock_control.get_motor_port_types = Mock(return_value={"NotConfigured": 0, "DcMotor": 1})
+
+        ports = create_motor_port_handler(mock_control)
+        port = ports[1]
+
+        driver = port.configure({"driver": DcMotorController, "config": TestDcMotorDriver.config})
+        self.assertEqual(driver.set_power, port.set_power)
+        self.assertEqual(driver.create_set_power_command, port.create_set_power_command)
+
+        driver = port.configure(None)
+        self.assertEqual(driver.set_power, port.set_power)
+        self.assertRaises(AttributeError, lambda: port.create_set_power_command)
+
 
 class TestDcMotorDriver(unittest.TestCase):
     config = {
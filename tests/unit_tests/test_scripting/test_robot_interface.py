@@ -70,3 +70,13 @@ class TestPortCollection(unittest.TestCase):
         self.assertEqual(3, pc['bar'])
         self.assertEqual(5, pc['baz'])
         self.assertRaises(KeyError, lambda: pc['foobar'])
+
+    def test_changing_an_alias_updates_port_lookup(self):
+        pc = PortCollection([2, 3, 5])
+        pc.aliases.update({'foo': 1})
+        pc.aliases['foo'] = 3
+
+        self.assertEqual(5, pc['foo'])
+
+        del pc.aliases['foo']
+        self.assertRaises(KeyError, lambda: pc['foo'])
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: GPL-3.0-only
 import argparse
 import sys
+from collections import deque
 
 from revvy.robot.configurations import Sensors
 from revvy.utils.thread_wrapper import periodic
@@ -32,31 +33,31 @@ if __name__ == "__main__":
         print('No ports configured')
         sys.exit(0)
 
-    pattern = "{0:0.2f}"
-    if args.s1:
-        pattern += "\t{1}"
-    if args.s2:
-        pattern += "\t{2}"
-    if args.s3:
-        pattern += "\t{3}"
-    if args.s4:
-        pattern += "\t{4}"
-    if args.imu_yaw:
-        pattern += "\t{5}"
-    if args.raw_imu:
-        pattern += "\t{6}"
-    if args.raw_gyro:
-        pattern += "\t{7}"
+    # indexes of the enabled columns in sensor_data, the timestamp is always printed
+    enabled = [args.s1, args.s2, args.s3, args.s4, args.imu_yaw, args.raw_imu, args.raw_gyro]
+    active_idx = [i for i, is_enabled in enumerate(enabled, start=1) if is_enabled]
 
     sensor_data_changed = False
     sensor_data = [0, None, None, None, None, None, None, None]
 
+    # sensor callbacks only queue the new values, they are processed in one pass by update()
+    sensor_updates = deque()
+
+    # one write call per line instead of print's separate writes for each part
+    write = sys.stdout.write
+
     with Robot() as robot:
         def update():
             global sensor_data_changed
             sensor_data_changed = False
             robot.update_status()
 
+            while sensor_updates:
+                idx, value = sensor_updates.popleft()
+                if value != sensor_data[idx]:
+                    sensor_data[idx] = value
+                    sensor_data_changed = True
+
             if args.imu_yaw:
                 angle = robot.imu.yaw_angle
                 if angle != sensor_data[5]:
@@ -77,18 +78,13 @@ if __name__ == "__main__":
 
             if sensor_data_changed:
                 sensor_data[0] = round(robot.time(), 2)
-                print("\nread_ports  80:", pattern.format(*sensor_data), "\n")
-
-        def sensor_value_changed(idx, value):
-            global sensor_data_changed
-            if value != sensor_data[idx]:
-                sensor_data[idx] = value
-                sensor_data_changed = True
+                columns = ''.join(f'\t{sensor_data[i]}' for i in active_idx)
+                write(f'\nread_ports  80: {sensor_data[0]:0.2f}{columns} \n\n')
 
         def configure_sensor(index, name):
             sensor = robot.sensors[index]
             sensor.configure(port_config_map[name])
-            sensor.on_status_changed.add(lambda p: sensor_value_changed(index, p.value))
+            sensor.on_status_changed.add(lambda p: sensor_updates.append((index, p.value)))
 
         robot.reset()
         status_update_thread = periodic(update, 0.02, "RobotStatusUpdaterThread")
@@ -106,3 +102,4 @@ if __name__ == "__main__":
         print('Press Enter to stop')
         input()
         status_update_thread.exit()
+        sys.stdout.flush()